@@ -0,0 +1,11 @@
+import pandas as pd
+
+# One-time conversion of the dashboard's CSV inputs to Parquet.
+# dashboard.py loads the .parquet files in preference to the CSVs when they exist,
+# so re-run this script whenever the CSVs are regenerated.
+TABLES = ['influencers', 'posts', 'tracking_data', 'payouts']
+
+for table in TABLES:
+    df = pd.read_csv(f'{table}.csv')
+    df.to_parquet(f'{table}.parquet', engine='pyarrow', compression='snappy', index=False)
+    print(f"Wrote {table}.parquet ({len(df)} rows)")
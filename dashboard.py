@@ -1,3 +1,5 @@
+import os
+
 import streamlit as st
 import pandas as pd
 import numpy as np
@@ -15,37 +17,89 @@ st.markdown("A deep-dive into campaign performance, influencer insights, and key
 st.write("---")
 
 # --- 1. Data Ingestion ---
-try:
-    influencers_df = pd.read_csv('influencers.csv')
-    posts_df = pd.read_csv('posts.csv')
-    tracking_df = pd.read_csv('tracking_data.csv')
-    payouts_df = pd.read_csv('payouts.csv')
-except FileNotFoundError:
-    st.error("CSV files not found. Please run the data generation script first.")
-    st.stop()
-
-# --- Data Merging and Pre-processing ---
-campaign_data = pd.merge(tracking_df, influencers_df, left_on='influencer_id', right_on='ID', how='left')
-campaign_data = pd.merge(campaign_data, payouts_df, on='influencer_id', how='left')
-
-# Additional data cleaning and filling NaNs
-campaign_data['category'].fillna('Organic', inplace=True)
-campaign_data['platform'].fillna('Organic', inplace=True)
-campaign_data['total_payout'].fillna(0, inplace=True)
-campaign_data['revenue'].fillna(0, inplace=True)
-campaign_data['date'] = pd.to_datetime(campaign_data['date'])
+DATA_TABLES = ('influencers', 'posts', 'tracking_data', 'payouts')
+
+def data_file_path(table):
+    # Prefer the Parquet copy written by convert_csvs_to_parquet.py, falling back to the raw CSV
+    parquet_path = f'{table}.parquet'
+    return parquet_path if os.path.exists(parquet_path) else f'{table}.csv'
+
+def read_table(table):
+    # Arrow-backed columns, so st.dataframe can hand them to the frontend without conversion
+    path = data_file_path(table)
+    if path.endswith('.parquet'):
+        return pd.read_parquet(path, dtype_backend='pyarrow')
+    return pd.read_csv(path, dtype_backend='pyarrow')
+
+def data_files_mtime():
+    # Modification times of the source files; passed to load_data so the cache is invalidated when they change
+    paths = [data_file_path(table) for table in DATA_TABLES]
+    return tuple(os.path.getmtime(path) if os.path.exists(path) else None for path in paths)
+
+@st.cache_data(ttl=None)
+def load_data(files_mtime):
+    try:
+        influencers_df = read_table('influencers')
+        posts_df = read_table('posts')
+        tracking_df = read_table('tracking_data')
+        payouts_df = read_table('payouts')
+    except FileNotFoundError:
+        st.error("Data files not found. Please run the data generation script first.")
+        st.stop()
+
+    # --- Data Merging and Pre-processing ---
+    # Join against pre-indexed lookup tables; ID is kept as a column for the per-influencer groupbys
+    campaign_data = (
+        tracking_df
+        .join(influencers_df.set_index('ID', drop=False), on='influencer_id', how='left')
+        .join(payouts_df.set_index('influencer_id'), on='influencer_id', how='left', lsuffix='_x', rsuffix='_y')
+    )
+
+    # Fill NaNs and set the final dtypes in one chained pass. The low-cardinality groupby/filter keys become
+    # categoricals (grouped on integer codes), and the amounts are downcast to float32 where that is lossless.
+    campaign_data = (
+        campaign_data
+        .fillna({'category': 'Organic', 'platform': 'Organic', 'total_payout': 0, 'revenue': 0})
+        .astype({'category': 'category', 'platform': 'category', 'source': 'category'})
+        .assign(
+            revenue=lambda df: pd.to_numeric(df['revenue'], downcast='float'),
+            total_payout=lambda df: pd.to_numeric(df['total_payout'], downcast='float'),
+            date=lambda df: pd.to_datetime(df['date']),
+        )
+    )
+    influencers_df['name'] = influencers_df['name'].astype('category')
+    for column in ['reach', 'likes', 'comments']:
+        posts_df[column] = pd.to_numeric(posts_df[column], downcast='unsigned')
+
+    # Keep rows in date order so a date range is a contiguous slice
+    campaign_data = campaign_data.sort_values('date', kind='stable').reset_index(drop=True)
+
+    # Sidebar options, which only change when the data does
+    min_date = campaign_data['date'].min()
+    max_date = campaign_data['date'].max()
+    unique_categories = ['All'] + sorted(influencers_df['category'].unique().tolist())
+    unique_platforms = ['All'] + sorted(influencers_df['platform'].unique().tolist())
+
+    # Organic revenue over the whole dataset; the Incremental ROAS baseline doesn't depend on the filters
+    organic_revenue_baseline = tracking_df.loc[tracking_df['source'] == 'organic', 'revenue'].sum()
+
+    # Per-influencer daily totals, much smaller than campaign_data; the leaderboard is filtered and re-summed from this
+    daily_by_influencer = campaign_data.groupby(['date', 'ID', 'category', 'platform'], observed=True)[['revenue', 'total_payout']].sum()
+    return (influencers_df, posts_df, tracking_df, payouts_df, campaign_data, daily_by_influencer,
+            organic_revenue_baseline, min_date, max_date, unique_categories, unique_platforms)
+
+files_mtime = data_files_mtime()
+(influencers_df, posts_df, tracking_df, payouts_df, campaign_data, daily_by_influencer,
+ organic_revenue_baseline, min_date, max_date, unique_categories, unique_platforms) = load_data(files_mtime)
 
 
 # --- 2. Interactive Filters ---
 st.sidebar.header("Filter Campaigns ⚙️")
 with st.sidebar:
     # Date range filter
-    min_date = campaign_data['date'].min()
-    max_date = campaign_data['date'].max()
     date_range = st.date_input("Select Date Range:", value=(min_date, max_date))
 
     # Multi-select for categories
-    unique_categories = ['All'] + list(influencers_df['category'].unique())
     selected_categories = st.multiselect(
         "Select Influencer Categories:",
         options=unique_categories,
@@ -53,29 +107,43 @@ with st.sidebar:
     )
 
     # Multi-select for platforms
-    unique_platforms = ['All'] + list(influencers_df['platform'].unique())
     selected_platforms = st.multiselect(
         "Select Platforms:",
         options=unique_platforms,
         default='All'
     )
     
-# Apply all filters
-filtered_df = campaign_data.copy()
-if 'All' not in selected_categories:
-    filtered_df = filtered_df[filtered_df['category'].isin(selected_categories)]
-if 'All' not in selected_platforms:
-    filtered_df = filtered_df[filtered_df['platform'].isin(selected_platforms)]
+# Apply all filters. campaign_data is sorted by date, so the date range is located by binary search
+# and the category/platform masks only have to scan the rows inside it.
+date_slice = campaign_data
 if date_range:
     start_date, end_date = date_range
-    filtered_df = filtered_df[(filtered_df['date'] >= pd.Timestamp(start_date)) & (filtered_df['date'] <= pd.Timestamp(end_date))]
+    lo, hi = campaign_data['date'].searchsorted([pd.Timestamp(start_date), pd.Timestamp(end_date) + pd.Timedelta(days=1)])
+    date_slice = campaign_data.iloc[lo:hi]
+# Accumulate the remaining predicates into one boolean array so only the surviving rows are copied
+mask = np.ones(len(date_slice), dtype=bool)
+if 'All' not in selected_categories:
+    mask &= date_slice['category'].isin(selected_categories).to_numpy()
+if 'All' not in selected_platforms:
+    mask &= date_slice['platform'].isin(selected_platforms).to_numpy()
+filtered_df = date_slice if mask.all() else date_slice[mask]
+
+# Identifies the current data + filter selection; used as the cache key for the aggregations below
+filter_key = (files_mtime, tuple(selected_categories), tuple(selected_platforms), tuple(date_range))
 
 # --- 3. Key Performance Indicators (KPIs) ---
+def summarize_by_source(df):
+    # Revenue and payouts per source (influencer/organic), so all KPI totals come from one groupby pass
+    return df.groupby('source', observed=True)[['revenue', 'total_payout']].sum()
+
+def source_revenue(source_summary, source):
+    return source_summary.at[source, 'revenue'] if source in source_summary.index else 0
+
 st.header("Campaign Overview 📈")
-total_revenue = filtered_df['revenue'].sum()
-total_payout = filtered_df['total_payout'].sum()
-organic_revenue_baseline = tracking_df[tracking_df['source'] == 'organic']['revenue'].sum()
-influencer_revenue = filtered_df[filtered_df['source'] == 'influencer']['revenue'].sum()
+source_summary = summarize_by_source(filtered_df)
+total_revenue = source_summary['revenue'].sum()
+total_payout = source_summary['total_payout'].sum()
+influencer_revenue = source_revenue(source_summary, 'influencer')
 
 # Calculations
 roi = (total_revenue - total_payout) / total_payout if total_payout > 0 else 0
@@ -93,89 +161,143 @@ with col4:
 st.write("---")
 
 # --- 4. Detailed Performance and Insights ---
-st.header("Detailed Performance 🔍")
+def add_roi(performance):
+    revenue = performance['total_revenue'].to_numpy()
+    payout = performance['total_payout'].to_numpy()
+    # Safe division in one pass: groups with no payout get an ROI of 0 instead of inf/NaN
+    performance['ROI'] = np.where(payout > 0, (revenue - payout) / np.where(payout == 0, 1, payout), 0.0)
+    return performance
 
-# Revenue trend over time
-st.subheader("Revenue & Payouts Over Time")
-time_series_data = filtered_df.groupby(filtered_df['date'].dt.date).agg(
-    total_revenue=('revenue', 'sum'),
-    total_payout=('total_payout', 'sum')
-).reset_index()
-fig_time = px.line(
-    time_series_data,
-    x='date',
-    y=['total_revenue', 'total_payout'],
-    labels={'value': 'Amount (₹)', 'variable': 'Metric'},
-    title='Daily Revenue vs. Payouts',
-    template='plotly_dark'
-)
-st.plotly_chart(fig_time, use_container_width=True)
+def aggregate_performance(df, key):
+    # Revenue, payouts and ROI per `key`, computed in a single groupby pass
+    performance = df.groupby(key, observed=True).agg(
+        total_revenue=('revenue', 'sum'),
+        total_payout=('total_payout', 'sum')
+    ).reset_index()
+    return add_roi(performance)
 
-# Performance by platform and category
-col_chart1, col_chart2 = st.columns(2)
-with col_chart1:
-    st.subheader("Revenue by Platform")
-    platform_revenue = filtered_df.groupby('platform')['revenue'].sum().reset_index()
-    fig_platform = px.bar(
-        platform_revenue,
+# The chart section and the report share these, so each breakdown is computed once per filter selection.
+# The leading underscore tells Streamlit not to hash the frame; filter_key already identifies it.
+@st.cache_data
+def compute_category_perf(filter_key, _filtered_df):
+    return aggregate_performance(_filtered_df, 'category')
+
+@st.cache_data
+def compute_platform_perf(filter_key, _filtered_df):
+    return aggregate_performance(_filtered_df, 'platform')
+
+def compute_influencer_perf(filter_key, _daily_by_influencer):
+    # Slice the pre-aggregated daily table to the date range, re-sum per influencer, then apply
+    # the category/platform filters to the (small) per-influencer result
+    _, selected_categories, selected_platforms, date_range = filter_key
+    daily = _daily_by_influencer
+    if date_range:
+        start_date, end_date = date_range
+        daily = daily.loc[pd.Timestamp(start_date):pd.Timestamp(end_date)]
+    performance = daily.groupby(level=['ID', 'category', 'platform'], observed=True).sum().reset_index()
+    if 'All' not in selected_categories:
+        performance = performance[performance['category'].isin(selected_categories)]
+    if 'All' not in selected_platforms:
+        performance = performance[performance['platform'].isin(selected_platforms)]
+    performance = performance.rename(columns={'revenue': 'total_revenue'})[['ID', 'total_revenue', 'total_payout']]
+    return add_roi(performance.reset_index(drop=True))
+
+@st.cache_data
+def compute_influencer_leaderboard(filter_key, _daily_by_influencer, _influencers_df):
+    # Per-influencer performance merged with name/category/platform and sorted by ROI, shared by the
+    # leaderboard and the report so the join and sort happen once per filter selection
+    leaderboard = pd.merge(
+        compute_influencer_perf(filter_key, _daily_by_influencer),
+        _influencers_df[['ID', 'name', 'category', 'platform']],
+        on='ID'
+    )
+    return leaderboard.sort_values(by='ROI', ascending=False)
+
+# Figure builders are cached on the (small) aggregated frames they plot, so unchanged data skips rebuilding the traces
+@st.cache_data
+def make_line_fig(ts_df):
+    return px.line(
+        ts_df,
+        x='date',
+        y=['total_revenue', 'total_payout'],
+        labels={'value': 'Amount (₹)', 'variable': 'Metric'},
+        title='Daily Revenue vs. Payouts',
+        template='plotly_dark'
+    )
+
+@st.cache_data
+def make_platform_fig(platform_df):
+    return px.bar(
+        platform_df,
         x='platform',
-        y='revenue',
+        y='total_revenue',
+        labels={'total_revenue': 'revenue'},
         title="Total Revenue by Platform",
         color='platform',
         template='plotly_dark'
     )
-    st.plotly_chart(fig_platform, use_container_width=True)
 
-with col_chart2:
-    st.subheader("Performance by Category")
-    category_revenue = filtered_df.groupby('category').agg(
-        total_revenue=('revenue', 'sum'),
-        total_payout=('total_payout', 'sum')
-    ).reset_index()
-    category_revenue['ROI'] = (category_revenue['total_revenue'] - category_revenue['total_payout']) / category_revenue['total_payout']
-    fig_category = px.bar(
-        category_revenue,
+@st.cache_data
+def make_category_fig(category_df):
+    return px.bar(
+        category_df,
         x='category',
         y='ROI',
         title="ROI by Influencer Category",
         color='category',
         template='plotly_dark'
     )
-    st.plotly_chart(fig_category, use_container_width=True)
 
-# Top and Poor Performing Influencers
-st.subheader("Influencer Leaderboard 🏆")
-influencer_performance = filtered_df.groupby('ID').agg(
+st.header("Detailed Performance 🔍")
+
+# Revenue trend over time
+st.subheader("Revenue & Payouts Over Time")
+time_series_data = filtered_df.groupby(filtered_df['date'].dt.date).agg(
     total_revenue=('revenue', 'sum'),
     total_payout=('total_payout', 'sum')
 ).reset_index()
-influencer_performance['ROI'] = (influencer_performance['total_revenue'] - influencer_performance['total_payout']) / influencer_performance['total_payout']
-influencer_performance.replace([np.inf, -np.inf], np.nan, inplace=True)
-influencer_performance.fillna(0, inplace=True) # Fill NaNs (for influencers with no payout) with 0
-
-# Merge with influencer details for name and platform
-influencer_performance = pd.merge(influencer_performance, influencers_df[['ID', 'name', 'category', 'platform']], on='ID')
-influencer_performance = influencer_performance.sort_values(by='ROI', ascending=False)
-
-# Display top and poor performers in two columns
-col_top, col_poor = st.columns(2)
-with col_top:
-    st.markdown("#### Top 10 Influencers by ROI")
-    st.dataframe(
-        influencer_performance.head(10)[['name', 'platform', 'category', 'ROI', 'total_revenue', 'total_payout']].rename(
-            columns={'name': 'Influencer', 'platform': 'Platform', 'category': 'Category'}
-        ).style.format({'ROI': '{:.2%}'}),
-        use_container_width=True
-    )
+st.plotly_chart(make_line_fig(time_series_data), use_container_width=True)
 
-with col_poor:
-    st.markdown("#### Poor Performing Influencers")
-    st.dataframe(
-        influencer_performance.tail(10)[['name', 'platform', 'category', 'ROI', 'total_revenue', 'total_payout']].rename(
-            columns={'name': 'Influencer', 'platform': 'Platform', 'category': 'Category'}
-        ).style.format({'ROI': '{:.2%}'}),
-        use_container_width=True
-    )
+# Performance by platform and category
+col_chart1, col_chart2 = st.columns(2)
+with col_chart1:
+    st.subheader("Revenue by Platform")
+    platform_revenue = compute_platform_perf(filter_key, filtered_df)
+    st.plotly_chart(make_platform_fig(platform_revenue), use_container_width=True)
+
+with col_chart2:
+    st.subheader("Performance by Category")
+    category_revenue = compute_category_perf(filter_key, filtered_df)
+    st.plotly_chart(make_category_fig(category_revenue), use_container_width=True)
+
+# Top and Poor Performing Influencers
+# Rendered as a fragment so interactions inside the leaderboard only rerun this block
+@st.fragment
+def leaderboard_section(filter_key, daily_by_influencer, influencers_df):
+    st.subheader("Influencer Leaderboard 🏆")
+    influencer_performance = compute_influencer_leaderboard(filter_key, daily_by_influencer, influencers_df)
+
+    # Display top and poor performers in two columns
+    col_top, col_poor = st.columns(2)
+    with col_top:
+        st.markdown("#### Top 10 Influencers by ROI")
+        st.dataframe(
+            influencer_performance.head(10)[['name', 'platform', 'category', 'ROI', 'total_revenue', 'total_payout']].rename(
+                columns={'name': 'Influencer', 'platform': 'Platform', 'category': 'Category'}
+            ).style.format({'ROI': '{:.2%}'}),
+            use_container_width=True
+        )
+
+    with col_poor:
+        st.markdown("#### Poor Performing Influencers")
+        st.dataframe(
+            influencer_performance.tail(10)[['name', 'platform', 'category', 'ROI', 'total_revenue', 'total_payout']].rename(
+                columns={'name': 'Influencer', 'platform': 'Platform', 'category': 'Category'}
+            ).style.format({'ROI': '{:.2%}'}),
+            use_container_width=True
+        )
+
+leaderboard_section(filter_key, daily_by_influencer, influencers_df)
 st.write("---")
 
 # --- 5. Optional: Post Performance ---
@@ -192,90 +314,78 @@ st.dataframe(
 # --- 6. Generate Detailed Insight Report ---
 st.header("Generate Detailed Insight Report 📄")
 
-def generate_detailed_report(filtered_df, influencers_df):
-    report = "### Detailed Campaign Insights Report\n\n"
-    report += "This report provides a comprehensive, plain-language summary of the campaign's performance, key influencers, and trends.\n\n"
+def generate_detailed_report(filter_key, filtered_df, daily_by_influencer, influencers_df):
+    parts = []
+    parts.append("### Detailed Campaign Insights Report\n\n")
+    parts.append("This report provides a comprehensive, plain-language summary of the campaign's performance, key influencers, and trends.\n\n")
     
     # 1. Overall Summary
-    total_revenue_val = filtered_df['revenue'].sum()
-    total_payout_val = filtered_df['total_payout'].sum()
+    source_summary = summarize_by_source(filtered_df)
+    total_revenue_val = source_summary['revenue'].sum()
+    total_payout_val = source_summary['total_payout'].sum()
     roi_val = (total_revenue_val - total_payout_val) / total_payout_val if total_payout_val > 0 else 0
-    incremental_roas_val = ((filtered_df[filtered_df['source'] == 'influencer']['revenue'].sum() - filtered_df[filtered_df['source'] == 'organic']['revenue'].sum()) / total_payout_val) if total_payout_val > 0 else 0
+    incremental_roas_val = ((source_revenue(source_summary, 'influencer') - source_revenue(source_summary, 'organic')) / total_payout_val) if total_payout_val > 0 else 0
     
-    report += "#### 🚀 Overall Campaign Summary\n"
-    report += f"- **Total Revenue:** The campaign generated a total of ₹{total_revenue_val:,.2f}.\n"
-    report += f"- **Total Payouts:** The total cost for all influencer activities was ₹{total_payout_val:,.2f}.\n"
-    report += f"- **ROI:** The campaign achieved an outstanding ROI of **{roi_val:.2%}**, meaning for every rupee spent, we gained a return of {roi_val:.2%} in revenue.\n"
-    report += f"- **Incremental ROAS:** The incremental ROAS was **{incremental_roas_val:.2f}**, indicating that for every rupee spent, we generated ₹{incremental_roas_val:.2f} in *new* revenue that we wouldn't have earned otherwise.\n\n"
+    parts.append("#### 🚀 Overall Campaign Summary\n")
+    parts.append(f"- **Total Revenue:** The campaign generated a total of ₹{total_revenue_val:,.2f}.\n")
+    parts.append(f"- **Total Payouts:** The total cost for all influencer activities was ₹{total_payout_val:,.2f}.\n")
+    parts.append(f"- **ROI:** The campaign achieved an outstanding ROI of **{roi_val:.2%}**, meaning for every rupee spent, we gained a return of {roi_val:.2%} in revenue.\n")
+    parts.append(f"- **Incremental ROAS:** The incremental ROAS was **{incremental_roas_val:.2f}**, indicating that for every rupee spent, we generated ₹{incremental_roas_val:.2f} in *new* revenue that we wouldn't have earned otherwise.\n\n")
     
     # 2. Performance by Category & Platform
-    category_performance = filtered_df.groupby('category').agg(
-        total_revenue=('revenue', 'sum'),
-        total_payout=('total_payout', 'sum')
-    ).reset_index()
-    category_performance['ROI'] = (category_performance['total_revenue'] - category_performance['total_payout']) / category_performance['total_payout']
-    category_performance.replace([np.inf, -np.inf], np.nan, inplace=True)
-    category_performance.fillna(0, inplace=True)
+    category_performance = compute_category_perf(filter_key, filtered_df)
     top_categories = category_performance.sort_values(by='ROI', ascending=False).head(3)
     
-    platform_performance = filtered_df.groupby('platform').agg(
-        total_revenue=('revenue', 'sum'),
-        total_payout=('total_payout', 'sum')
-    ).reset_index()
-    platform_performance['ROI'] = (platform_performance['total_revenue'] - platform_performance['total_payout']) / platform_performance['total_payout']
-    platform_performance.replace([np.inf, -np.inf], np.nan, inplace=True)
-    platform_performance.fillna(0, inplace=True)
+    platform_performance = compute_platform_perf(filter_key, filtered_df)
     top_platforms = platform_performance.sort_values(by='ROI', ascending=False).head(3)
     
-    report += "#### 📊 Performance Breakdown\n"
-    report += "##### Top Performing Categories:\n"
-    for _, row in top_categories.iterrows():
-        if row['category'] != 'Organic':
-            report += f"- The **{row['category']}** category achieved an impressive ROI of **{row['ROI']:.2%}** with a total revenue of ₹{row['total_revenue']:,.2f}.\n"
-    report += "\n##### Top Performing Platforms:\n"
-    for _, row in top_platforms.iterrows():
-        if row['platform'] != 'Organic':
-            report += f"- **{row['platform']}** was the most effective platform, with an ROI of **{row['ROI']:.2%}** and generating ₹{row['total_revenue']:,.2f} in revenue.\n"
-    report += "\n"
+    parts.append("#### 📊 Performance Breakdown\n")
+    parts.append("##### Top Performing Categories:\n")
+    parts.extend(
+        f"- The **{row.category}** category achieved an impressive ROI of **{row.ROI:.2%}** with a total revenue of ₹{row.total_revenue:,.2f}.\n"
+        for row in top_categories.itertuples(index=False) if row.category != 'Organic'
+    )
+    parts.append("\n##### Top Performing Platforms:\n")
+    parts.extend(
+        f"- **{row.platform}** was the most effective platform, with an ROI of **{row.ROI:.2%}** and generating ₹{row.total_revenue:,.2f} in revenue.\n"
+        for row in top_platforms.itertuples(index=False) if row.platform != 'Organic'
+    )
+    parts.append("\n")
     
     # 3. Influencer Performance
-    influencer_performance = filtered_df.groupby('ID').agg(
-        total_revenue=('revenue', 'sum'),
-        total_payout=('total_payout', 'sum')
-    ).reset_index()
-    influencer_performance['ROI'] = (influencer_performance['total_revenue'] - influencer_performance['total_payout']) / influencer_performance['total_payout']
-    influencer_performance.replace([np.inf, -np.inf], np.nan, inplace=True)
-    influencer_performance.fillna(0, inplace=True)
-    influencer_performance = pd.merge(influencer_performance, influencers_df[['ID', 'name', 'category', 'platform']], on='ID')
-    
-    top_influencers = influencer_performance.sort_values(by='ROI', ascending=False).head(3)
-    poor_influencers = influencer_performance.sort_values(by='ROI', ascending=True).head(3)
+    # The cached leaderboard is already sorted by ROI; the bottom slice is reversed so the worst performer is listed first
+    sorted_performance = compute_influencer_leaderboard(filter_key, daily_by_influencer, influencers_df)
+    top_influencers = sorted_performance.head(3)
+    poor_influencers = sorted_performance.tail(3).iloc[::-1]
     
-    report += "#### 🏆 Key Influencer Analysis\n"
-    report += "##### Top Performers:\n"
-    for _, row in top_influencers.iterrows():
-        report += f"- **{row['name']}** ({row['category']}): A standout performer, generating an ROI of **{row['ROI']:.2%}** from a total revenue of ₹{row['total_revenue']:,.2f}.\n"
-    report += "\n##### Underperformers:\n"
-    for _, row in poor_influencers.iterrows():
-        report += f"- **{row['name']}** ({row['category']}): Had a low ROI of {row['ROI']:.2%} and generated a total revenue of only ₹{row['total_revenue']:,.2f}. This influencer may need to be reevaluated for future campaigns.\n"
-    report += "\n"
+    parts.append("#### 🏆 Key Influencer Analysis\n")
+    parts.append("##### Top Performers:\n")
+    parts.extend(
+        f"- **{row.name}** ({row.category}): A standout performer, generating an ROI of **{row.ROI:.2%}** from a total revenue of ₹{row.total_revenue:,.2f}.\n"
+        for row in top_influencers.itertuples(index=False)
+    )
+    parts.append("\n##### Underperformers:\n")
+    parts.extend(
+        f"- **{row.name}** ({row.category}): Had a low ROI of {row.ROI:.2%} and generated a total revenue of only ₹{row.total_revenue:,.2f}. This influencer may need to be reevaluated for future campaigns.\n"
+        for row in poor_influencers.itertuples(index=False)
+    )
+    parts.append("\n")
     
-    return report
+    return ''.join(parts)
 
-if st.button("Generate Detailed Report"):
-    report_text = generate_detailed_report(filtered_df, influencers_df)
-    st.markdown(report_text)
+# Clicking the report buttons reruns only this fragment, not the KPIs and charts above
+@st.fragment
+def report_section(filter_key, filtered_df, daily_by_influencer, influencers_df):
+    if st.button("Generate Detailed Report"):
+        report_text = generate_detailed_report(filter_key, filtered_df, daily_by_influencer, influencers_df)
+        st.markdown(report_text)
     
-    # Add a download button for the generated report
-    st.download_button(
-        label="Download Report as Text",
-        data=report_text,
-        file_name='influencer_campaign_report.txt',
-        mime='text/plain',
-    )
-
-
-
-
-
+        # Add a download button for the generated report
+        st.download_button(
+            label="Download Report as Text",
+            data=report_text,
+            file_name='influencer_campaign_report.txt',
+            mime='text/plain',
+        )
 
+report_section(filter_key, filtered_df, daily_by_influencer, influencers_df)